@@ -7,10 +7,10 @@ from pathlib import Path
 from typing import Any
 
 try:
-    import tomli
+    import tomllib as tomli
 except ImportError:
     try:
-        import tomllib as tomli
+        import tomli
     except ImportError:
         print("Error: tomli required. Install with: pip install tomli")
         sys.exit(1)
@@ -22,6 +22,8 @@ ENV_PATH = ".env.example"
 
 DEFAULT_PORT = 9009
 
+ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
 COMPOSE_TEMPLATE = """# Auto-generated from scenario.toml
 
 services:
@@ -79,10 +81,16 @@ agentbeats_id = "{green_id}"
 {participants}
 {config}"""
 
+A2A_PARTICIPANT_TEMPLATE = """[[participants]]
+role = "{name}"
+endpoint = "http://{name}:{port}"
+agentbeats_id = "{agentbeats_id}"
+"""
+
 
 def parse_scenario(scenario_path: Path) -> dict[str, Any]:
-    toml_data = scenario_path.read_text()
-    data = tomli.loads(toml_data)
+    with open(scenario_path, "rb") as f:
+        data = tomli.load(f)
 
     participants = data.get("participants", [])
     for participant in participants:
@@ -169,14 +177,14 @@ def generate_a2a_scenario(scenario: dict[str, Any]) -> str:
     green = scenario["green_agent"]
     participants = scenario.get("participants", [])
 
-    participant_lines = []
-    for p in participants:
-        participant_lines.append(
-            f"[[participants]]\n"
-            f"role = \"{p['name']}\"\n"
-            f"endpoint = \"http://{p['name']}:{DEFAULT_PORT}\"\n"
-            f"agentbeats_id = \"{p['agentbeats_id']}\"\n"
+    participant_lines = [
+        A2A_PARTICIPANT_TEMPLATE.format(
+            name=p["name"],
+            port=DEFAULT_PORT,
+            agentbeats_id=p["agentbeats_id"]
         )
+        for p in participants
+    ]
 
     config_section = scenario.get("config", {})
 
@@ -194,16 +202,9 @@ def generate_env_file(scenario: dict[str, Any]) -> str:
 
     secrets = set()
 
-    env_var_pattern = re.compile(r'\$\{([^}]+)\}')
-
-    for value in green.get("env", {}).values():
-        for match in env_var_pattern.findall(str(value)):
-            secrets.add(match)
-
-    for p in participants:
-        for value in p.get("env", {}).values():
-            for match in env_var_pattern.findall(str(value)):
-                secrets.add(match)
+    for agent in [green] + participants:
+        for value in agent.get("env", {}).values():
+            secrets.update(ENV_VAR_PATTERN.findall(str(value)))
 
     if not secrets:
         return ""
@@ -220,12 +221,12 @@ def main():
     parser.add_argument("--scenario", type=Path)
     args = parser.parse_args()
 
-    if not args.scenario.exists():
+    try:
+        scenario = parse_scenario(args.scenario)
+    except FileNotFoundError:
         print(f"Error: {args.scenario} not found")
         sys.exit(1)
 
-    scenario = parse_scenario(args.scenario)
-
     with open(COMPOSE_PATH, "w") as f:
         f.write(generate_docker_compose(scenario))
 